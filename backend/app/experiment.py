@@ -9,7 +9,7 @@ from typing import Dict, List, Optional, Sequence, Set, Tuple
 from anthropic import Anthropic
 
 from .models import ExperimentMetrics, ExperimentResponse, PolicyRule
-from .prompt_generator import PromptGenerator
+from .prompt_generator import PromptGenerator, _predicate_value, _targets
 from .symbolic import SymbolicRule, INTENT_DIMENSIONS, PERSPECTIVE_DIMENSIONS
 
 
@@ -256,9 +256,14 @@ class SymbolicGuidedAttacker:
         for rule, symbolic in zip(self.rules, self.symbolic_rules):
             intents = symbolic.dimensions.get("intent") or [INTENT_DIMENSIONS[0]]
             perspectives = symbolic.dimensions.get("perspective") or [PERSPECTIVE_DIMENSIONS[0]]
+            predicate_map = symbolic.predicate_map()
+            domain = _predicate_value(predicate_map, "domain", "general")
+            target, secondary = _targets(rule)
             for intent in intents:
                 for perspective in perspectives:
-                    text = self._build_prompt(rule, symbolic, intent, perspective)
+                    text = self._build_prompt(
+                        rule, symbolic, predicate_map, domain, target, secondary, intent, perspective
+                    )
                     prompts.append(text)
                     rules_hit.add(rule.id)
                     signature = self.signature_lookup.get(
@@ -274,10 +279,18 @@ class SymbolicGuidedAttacker:
         )
 
     def _build_prompt(
-        self, rule: PolicyRule, symbolic: SymbolicRule, intent: str, perspective: str
+        self,
+        rule: PolicyRule,
+        symbolic: SymbolicRule,
+        predicate_map: Dict[str, Tuple[str, str]],
+        domain: str,
+        target: str,
+        secondary: str,
+        intent: str,
+        perspective: str,
     ) -> str:
         builder = self._builder_for(perspective)
-        text = builder(rule, symbolic, intent, perspective).strip()
+        text = builder(predicate_map, domain, target, secondary, intent, perspective).strip()
         signature = self.signature_lookup.get(
             (rule.id, intent, perspective),
             f"{rule.id}:{intent}:{perspective}",
@@ -369,10 +382,10 @@ class ExperimentRunner:
         total_regions = 0  # track how many (rule × intent × perspective) regions exist
         for symbolic in symbolic_rules:
             predicate_map = symbolic.predicate_map()
-            default_intent = predicate_map.get("intent", ("=", INTENT_DIMENSIONS[0]))[1]
-            default_perspective = predicate_map.get(
-                "perspective", ("=", PERSPECTIVE_DIMENSIONS[0])
-            )[1]
+            default_intent = _predicate_value(predicate_map, "intent", INTENT_DIMENSIONS[0])
+            default_perspective = _predicate_value(
+                predicate_map, "perspective", PERSPECTIVE_DIMENSIONS[0]
+            )
             intents = symbolic.dimensions.get("intent") or [default_intent]
             perspectives = symbolic.dimensions.get("perspective") or [default_perspective]
             total_regions += len(intents) * len(perspectives)  # add per-rule region count once
@@ -384,7 +397,7 @@ class ExperimentRunner:
                         perspective_override=perspective,
                     )
                     if signature_tuple:
-                        lookup[(symbolic.rule_id, intent, perspective)] = " ∧ ".join(
+                        lookup[(symbolic.rule_id, intent, perspective)] = " & ".join(
                             signature_tuple
                         )
                     else:
@@ -2,11 +2,19 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from typing import List, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; per-sentence calls skip the re module cache probe.
+_AMR_ARG_RE = re.compile(r":ARG\d+\s+\(([\w\-]+)\s+/\s+([\w\-]+)\)")
+_NEGATIVE_RE = re.compile(r"must not|never|cannot|forbid|ban")
+_POSITIVE_RE = re.compile(r"allowed|may|permitted|can")
+
 try:
     import amrlib  # type: ignore
 except Exception:  # pragma: no cover
@@ -17,6 +25,15 @@ try:
 except Exception:  # pragma: no cover
     load_predictor = None
 
+try:
+    import torch  # type: ignore
+except Exception:  # pragma: no cover
+    torch = None
+
+# Sentences of similar token length are predicted together so batches carry
+# minimal padding.
+_SRL_BUCKET_SIZE = 16
+
 
 @dataclass
 class SemanticParseResult:
@@ -31,17 +48,46 @@ class SemanticParser:
     """Best-effort semantic parser using AMR + semantic role labeling when available."""
 
     def __init__(self) -> None:
+        # Model downloads and checkpoint loads can take minutes; run them on a
+        # daemon thread so constructing the parser never blocks startup. The
+        # first parse_sentences call joins the thread if loading is still
+        # underway.
+        self._amr = None
+        self._semparse = None
+        self._loader = threading.Thread(target=self._load_models, daemon=True)
+        self._loader.start()
+
+    def _load_models(self) -> None:
         self._amr = self._init_amr()
         self._semparse = self._init_semparse()
 
+    def _wait_if_loading(self) -> None:
+        if self._loader.is_alive():
+            self._loader.join()
+
     def parse_sentences(self, sentences: Sequence[str]) -> List[SemanticParseResult]:
-        amr_graphs = self._run_amr(sentences)
+        self._wait_if_loading()
+        if self._amr and self._semparse and sentences:
+            # The two models are independent and release the GIL inside native
+            # inference, so running them concurrently costs max(AMR, SRL)
+            # instead of their sum.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                amr_future = executor.submit(self._run_amr, sentences)
+                srl_future = executor.submit(self._run_semparse, sentences)
+                amr_graphs = amr_future.result()
+                srl_extractions = srl_future.result()
+        else:
+            amr_graphs = self._run_amr(sentences)
+            srl_extractions = self._run_semparse(sentences)
         results: List[SemanticParseResult] = []
         for idx, sentence in enumerate(sentences):
             amr = amr_graphs[idx] if idx < len(amr_graphs) else None
             intents, entities = self._extract_from_amr(amr)
             polarity = self._infer_polarity(sentence, amr)
-            sem_intents, sem_entities = self._run_semparse(sentence)
+            if idx < len(srl_extractions):
+                sem_intents, sem_entities = srl_extractions[idx]
+            else:  # pragma: no cover
+                sem_intents, sem_entities = [], []
             intents.extend(sem_intents)
             entities.extend(sem_entities)
             results.append(
@@ -82,14 +128,32 @@ class SemanticParser:
             logger.warning("AMR parsing failed: %s", exc)
             return [None] * len(sentences)
 
-    def _run_semparse(self, sentence: str) -> tuple[List[str], List[str]]:
-        if not self._semparse:
-            return [], []
+    def _run_semparse(
+        self, sentences: Sequence[str]
+    ) -> List[tuple[List[str], List[str]]]:
+        if not self._semparse or not sentences:
+            return [([], []) for _ in sentences]
+        # Batching amortizes tokenization and model setup; bucketing by token
+        # count keeps each batch free of padding waste from length outliers.
+        order = sorted(range(len(sentences)), key=lambda i: len(sentences[i].split()))
+        extractions: List[tuple[List[str], List[str]]] = [([], []) for _ in sentences]
+        guard = torch.inference_mode() if torch else nullcontext()
         try:
-            prediction = self._semparse.predict(sentence=sentence)  # type: ignore[operator]
+            with guard:
+                for start in range(0, len(order), _SRL_BUCKET_SIZE):
+                    bucket = order[start : start + _SRL_BUCKET_SIZE]
+                    predictions = self._semparse.predict_batch_json(  # type: ignore[operator]
+                        [{"sentence": sentences[i]} for i in bucket]
+                    )
+                    for idx, prediction in zip(bucket, predictions):
+                        extractions[idx] = self._extract_from_srl(prediction)
         except Exception as exc:  # pragma: no cover
             logger.warning("AllenNLP SRL failed: %s", exc)
-            return [], []
+            return [([], []) for _ in sentences]
+        return extractions
+
+    @staticmethod
+    def _extract_from_srl(prediction: dict) -> tuple[List[str], List[str]]:
         intents: List[str] = []
         entities: List[str] = []
         for verb in prediction.get("verbs", []):
@@ -106,7 +170,7 @@ class SemanticParser:
             return [], []
         intents: List[str] = []
         entities: List[str] = []
-        for match in re.finditer(r":ARG\d+\s+\(([\w\-]+)\s+/\s+([\w\-]+)\)", amr):
+        for match in _AMR_ARG_RE.finditer(amr):
             role = match.group(1)
             concept = match.group(2).replace("_", " ")
             if "intent" in role or role in {"goal", "purpose"}:
@@ -117,21 +181,19 @@ class SemanticParser:
 
     def _infer_polarity(self, text: str, amr: Optional[str]) -> Optional[str]:
         lowered = text.lower()
-        if any(token in lowered for token in ("must not", "never", "cannot", "forbid", "ban")):
+        if _NEGATIVE_RE.search(lowered):
             return "negative"
         if amr and ":polarity -" in amr:
             return "negative"
-        if any(token in lowered for token in ("allowed", "may", "permitted", "can")):
+        if _POSITIVE_RE.search(lowered):
             return "positive"
         return None
 
     def _dedupe(self, items: Sequence[str]) -> List[str]:
-        seen = set()
-        ordered: List[str] = []
-        for item in items:
-            normalized = item.strip().lower()
-            if not normalized or normalized in seen:
-                continue
-            seen.add(normalized)
-            ordered.append(normalized)
-        return ordered
+        if not items:
+            return []
+        # dict.fromkeys preserves insertion order, replacing the explicit
+        # seen-set bookkeeping with one C-level pass.
+        return list(
+            dict.fromkeys(s for s in (item.strip().lower() for item in items) if s)
+        )
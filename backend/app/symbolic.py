@@ -1,12 +1,46 @@
 from __future__ import annotations
 
+import copy
+import hashlib
+import logging
+import re
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
-from pydantic import BaseModel, Field
-
 if TYPE_CHECKING:
     from .models import PolicyRule
 
+logger = logging.getLogger(__name__)
+
+try:
+    import diskcache  # type: ignore
+except Exception:  # pragma: no cover
+    diskcache = None
+
+try:
+    import ahocorasick  # type: ignore
+except Exception:  # pragma: no cover
+    ahocorasick = None
+
+# Bump whenever the compilation logic or SymbolicRule layout changes so stale
+# cache entries are ignored.
+SYMBOLIC_VERSION = "3"
+
+
+def _init_disk_cache():
+    if not diskcache:
+        return None
+    try:
+        return diskcache.Cache(".symcache")
+    except Exception as exc:  # pragma: no cover
+        logger.warning("Failed to open symbolic compilation cache: %s", exc)
+        return None
+
+
+_DISK_CACHE = _init_disk_cache()
+
 
 DOMAIN_FROM_CATEGORY = {
     "medical": "medical",
@@ -18,6 +52,16 @@ DOMAIN_FROM_CATEGORY = {
     "political": "political",
 }
 
+DOMAIN_TEXT_PATTERNS = {
+    "medical": ("medical", "health", "diagnosis", "treatment", "symptom"),
+    "self_harm": ("self harm", "self-harm", "suicide"),
+    "violence": ("weapon", "attack", "harm", "fight", "explosive"),
+    "privacy": ("personal data", "pii", "address", "phone", "ssn"),
+    "financial": ("money", "loan", "credit", "investment", "bet"),
+    "copyright": ("copyright", "plagiarize", "piracy"),
+    "political": ("election", "propaganda", "campaign"),
+}
+
 INTENT_DIMENSIONS = ("procedural", "comparative", "optimization")
 PERSPECTIVE_DIMENSIONS = ("first_person", "third_person", "hypothetical")
 REQUEST_FRAMES = (
@@ -152,148 +196,367 @@ PREDICATE_ALIASES = {
     "Trigger": "trigger",
 }
 
+# Single-word markers backing the legacy fallback branches in the intent and
+# role helpers; scanned together with the main dictionaries so the helpers
+# never re-probe the text. "optimize" and the "non professional"/"non
+# clinician" fallbacks are omitted as dead code: their texts always hit
+# the optimization / "!=professional" / "=clinician" markers first.
+_FALLBACK_PATTERNS = {
+    "better": ("better",),
+    "than": ("than",),
+    "efficient": ("efficient",),
+    "professional": ("professional",),
+}
 
-class SymbolicRule(BaseModel):
-    """Symbolic constraints compiled from a single policy clause."""
+# Tokens _infer_request_frames probes beyond the marker dictionaries above.
+# They participate in the scan so an empty hit set guarantees a rule is
+# default-shaped in every dimension, including its request frames.
+_FRAME_PATTERNS = {
+    "cover": ("keep them safe",),
+    "academic": ("analysis",),
+    "narrative": ("narrative", "story", "character"),
+}
 
-    rule_id: str
-    quantifier: str = Field(default="forall")
-    variables: List[str] = Field(default_factory=list)
-    conditions: List[Tuple[str, str, str]] = Field(default_factory=list)
-    conclusion: Tuple[str, str] = Field(default=("Violation", "r"))
-    dimensions: Dict[str, List[str]] = Field(default_factory=dict)
-    predicates: List[str] = Field(default_factory=list)
-    violation: bool = Field(
-        default=True,
-        description="True when the clause expresses a prohibited behavior.",
+# Every marker dictionary the inference helpers consult, tagged with the
+# dimension it feeds. The scan collects which categories hit; the helpers
+# still resolve winners by pattern-dict order, so semantics match the old
+# per-dict substring loops exactly.
+_MARKER_SOURCES = (
+    ("domain", DOMAIN_TEXT_PATTERNS),
+    ("intent", INTENT_PATTERNS),
+    ("context", CONTEXT_PATTERNS),
+    ("perspective", PERSPECTIVE_PATTERNS),
+    ("role", ROLE_PATTERNS),
+    ("trigger", EMOTIONAL_TRIGGERS),
+    ("fallback", _FALLBACK_PATTERNS),
+    ("frame", _FRAME_PATTERNS),
+)
+
+
+def _build_automaton():
+    if not ahocorasick:
+        return None
+    payloads: Dict[str, List[Tuple[str, str]]] = {}
+    for dimension, patterns in _MARKER_SOURCES:
+        for category, markers in patterns.items():
+            for marker in markers:
+                payloads.setdefault(marker, []).append((dimension, category))
+    for marker in VIOLATION_MARKERS:
+        payloads.setdefault(marker, []).append(("violation", marker))
+    for marker in ("allow", "permitted"):
+        payloads.setdefault(marker, []).append(("allowance", marker))
+    try:
+        automaton = ahocorasick.Automaton()
+        for marker, tags in payloads.items():
+            automaton.add_word(marker, tuple(tags))
+        automaton.make_automaton()
+    except Exception as exc:  # pragma: no cover
+        logger.warning("Failed to build marker automaton: %s", exc)
+        return None
+    return automaton
+
+
+_AUTOMATON = _build_automaton()
+
+
+def _build_category_patterns() -> List[Tuple[str, str, "re.Pattern[str]"]]:
+    """Zero-dependency fallback: one compiled alternation per category.
+
+    A single finditer pass over one big alternation cannot reproduce the old
+    semantics because overlapping markers shadow each other (e.g. matching
+    "harm reduction" would consume the "harm" domain hit), so each category
+    keeps its own C-level search instead.
+    """
+    compiled: List[Tuple[str, str, "re.Pattern[str]"]] = []
+    for dimension, patterns in _MARKER_SOURCES:
+        for category, markers in patterns.items():
+            alternation = "|".join(
+                re.escape(marker) for marker in sorted(markers, key=len, reverse=True)
+            )
+            compiled.append((dimension, category, re.compile(alternation)))
+    compiled.append(
+        ("violation", "violation", re.compile("|".join(re.escape(m) for m in VIOLATION_MARKERS)))
     )
+    compiled.append(("allowance", "allowance", re.compile("allow|permitted")))
+    return compiled
+
+
+_CATEGORY_PATTERNS = _build_category_patterns() if _AUTOMATON is None else []
+
+
+def _scan_markers(text: str) -> Dict[str, set]:
+    """Collect every marker hit in one pass as {dimension: {categories}}."""
+    hits: Dict[str, set] = {}
+    if _AUTOMATON is not None:
+        for _, tags in _AUTOMATON.iter(text):
+            for dimension, category in tags:
+                hits.setdefault(dimension, set()).add(category)
+        return hits
+    for dimension, category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(text):
+            hits.setdefault(dimension, set()).add(category)
+    return hits
+
+
+@dataclass(slots=True)
+class SymbolicRule:
+    """Symbolic constraints compiled from a single policy clause.
+
+    ``violation`` is True when the clause expresses a prohibited behavior.
+    Kept as a slots dataclass rather than a pydantic model: instances are
+    produced in bulk by the compiler and only cross a validation boundary
+    when FastAPI serializes them inside the response models.
+    """
+
+    rule_id: str
+    quantifier: str = "forall"
+    variables: List[str] = field(default_factory=list)
+    conditions: Tuple[Tuple[str, str, str], ...] = ()
+    conclusion: Tuple[str, str] = ("Violation", "r")
+    dimensions: Dict[str, List[str]] = field(default_factory=dict)
+    predicates: Tuple[str, ...] = ()
+    violation: bool = True
 
     def predicate_map(self) -> Dict[str, Tuple[str, str]]:
-        """Expose flattened predicates as {name: (operator, value)} for downstream logic."""
+        """Expose flattened predicates as {name: (operator, value)} for downstream logic.
+
+        Reads the structured conditions directly rather than re-splitting the
+        predicate strings they were rendered into, so building the map does no
+        string parsing at all.
+        """
         mapping: Dict[str, Tuple[str, str]] = {}
-        for expr in self.predicates:
-            if "!=" in expr:
-                key, value = expr.split("!=", 1)
-                mapping[key.strip()] = ("!=", value.strip())
-            elif "=" in expr:
-                key, value = expr.split("=", 1)
-                mapping[key.strip()] = ("=", value.strip())
+        for predicate, _, value in self.conditions:
+            name = PREDICATE_ALIASES.get(predicate, predicate.lower())
+            if value.startswith("!"):
+                mapping[name] = ("!=", value[1:])
+            else:
+                mapping[name] = ("=", value)
         return mapping
 
     def to_predicate_list(self) -> List[str]:
         """Flatten first-order clauses into compatibility predicates (e.g., domain=self_harm)."""
-        flattened: List[str] = []
-        for predicate, _, value in self.conditions:
-            normalized = PREDICATE_ALIASES.get(predicate, predicate.lower())
-            if value.startswith("!"):
-                flattened.append(f"{normalized}!={value[1:]}")
-            else:
-                flattened.append(f"{normalized}={value}")
-        return flattened
+        return [
+            _pred(PREDICATE_ALIASES.get(predicate, predicate.lower()), value)
+            for predicate, _, value in self.conditions
+        ]
 
 
 def compile_to_symbolic(rule: "PolicyRule") -> SymbolicRule:
-    """Deterministically translate a policy rule into symbolic first-order clauses."""
-    text = rule.text.lower()
+    """Deterministically translate a policy rule into symbolic first-order clauses.
+
+    Compilation is pure in (category, text), so results are memoized in-process
+    and cached on disk for reuse across restarts when experiment reruns
+    resubmit the same policy. Rule ids are regenerated per parse, so the
+    shared cached object is patched with the caller's id on the way out.
+    """
+    # Deep copy so caller-side mutation of the list fields can never leak
+    # back into the shared cache entry.
+    symbolic_rule = copy.deepcopy(_compile_cached(rule.category, rule.text))
+    symbolic_rule.rule_id = rule.id
+    return symbolic_rule
+
+
+@lru_cache(maxsize=4096)
+def _compile_cached(category: str, text: str) -> SymbolicRule:
+    if _DISK_CACHE is None:
+        return _compile_body(category, text)
+    digest = hashlib.blake2b(
+        f"{SYMBOLIC_VERSION}|{category}|{text}".encode()
+    ).hexdigest()
+    try:
+        cached = _DISK_CACHE.get(digest)
+    except Exception:  # pragma: no cover
+        cached = None
+    if cached is not None:
+        return cached
+    symbolic_rule = _compile_body(category, text)
+    try:
+        _DISK_CACHE.set(digest, symbolic_rule)
+    except Exception:  # pragma: no cover
+        pass
+    return symbolic_rule
 
-    domain = DOMAIN_FROM_CATEGORY.get(rule.category) or _infer_domain_from_text(text) or DEFAULT_DOMAIN
-    intent = _infer_intent(text, domain)
-    role_op, role_value = _infer_user_role(text)
-    context_op, context_value = _infer_context_clause(text)
-    perspective_op, perspective_value = _infer_perspective(text)
 
-    def _value_with_op(op: str, value: str) -> str:
-        return value if op == "=" else f"!{value}"
+def _compile_to_symbolic(rule: "PolicyRule") -> SymbolicRule:
+    """Uncached compilation path; prefer compile_to_symbolic."""
+    symbolic_rule = _compile_body(rule.category, rule.text)
+    symbolic_rule.rule_id = rule.id
+    return symbolic_rule
 
-    conditions: List[Tuple[str, str, str]] = [
-        ("Domain", "r", domain),
-        ("Intent", "r", intent),
-        ("UserRole", "r", _value_with_op(role_op, role_value)),
-        ("Context", "r", _value_with_op(context_op, context_value)),
-        ("Perspective", "r", _value_with_op(perspective_op, perspective_value)),
-    ]
 
-    for trigger in _infer_triggers(text):
-        conditions.append(("Trigger", "r", trigger))
+# Intent/perspective axes are the same for every rule; the lists are shared
+# read-only across cache entries and copied per caller by compile_to_symbolic.
+_INTENT_LIST = list(INTENT_DIMENSIONS)
+_PERSPECTIVE_LIST = list(PERSPECTIVE_DIMENSIONS)
+
+
+def _value_with_op(op: str, value: str) -> str:
+    return value if op == "=" else f"!{value}"
+
+
+# Flyweight pool for predicate strings: the same "domain=medical"-style token
+# recurs across most compiled rules, so format and intern it once.
+_PREDICATE_POOL: Dict[Tuple[str, str], str] = {}
+
+
+def _pred(name: str, value: str) -> str:
+    key = (name, value)
+    cached = _PREDICATE_POOL.get(key)
+    if cached is None:
+        if value.startswith("!"):
+            cached = sys.intern(f"{name}!={value[1:]}")
+        else:
+            cached = sys.intern(f"{name}={value}")
+        _PREDICATE_POOL[key] = cached
+    return cached
+
+
+# Default-shaped rules compile to the same SymbolicRule per category; build
+# that template once and clone it instead of re-running the assembly.
+_TEMPLATE_CACHE: Dict[str, SymbolicRule] = {}
+
+# Base condition/predicate tuple pairs keyed by their five inferred values;
+# rules with the same shape share one immutable pair, and deep copies alias
+# it for free.
+_CONDITIONS_POOL: Dict[
+    Tuple[str, str, str, str, str],
+    Tuple[Tuple[Tuple[str, str, str], ...], Tuple[str, ...]],
+] = {}
+
+
+def _default_template(category: str) -> SymbolicRule:
+    template = _TEMPLATE_CACHE.get(category)
+    if template is None:
+        template = _assemble(category, "", {})
+        _TEMPLATE_CACHE[category] = template
+    return template
+
+
+def _compile_body(category: str, text: str) -> SymbolicRule:
+    text = text.lower()
+    hits = _scan_markers(text)
+    if not hits:
+        # No marker matched anywhere, so every inference helper would return
+        # its default; reuse the per-category template.
+        return copy.deepcopy(_default_template(category))
+    return _assemble(category, text, hits)
+
+
+def _assemble(category: str, text: str, hits: Dict[str, set]) -> SymbolicRule:
+    domain = DOMAIN_FROM_CATEGORY.get(category) or _infer_domain_from_text(hits) or DEFAULT_DOMAIN
+    intent = _infer_intent(hits, domain)
+    role_op, role_value = _infer_user_role(hits)
+    context_op, context_value = _infer_context_clause(hits, text)
+    perspective_op, perspective_value = _infer_perspective(hits)
+
+    role = _value_with_op(role_op, role_value)
+    context = _value_with_op(context_op, context_value)
+    perspective = _value_with_op(perspective_op, perspective_value)
+    base_key = (domain, intent, role, context, perspective)
+    pooled = _CONDITIONS_POOL.get(base_key)
+    if pooled is None:
+        base_conditions = (
+            ("Domain", "r", domain),
+            ("Intent", "r", intent),
+            ("UserRole", "r", role),
+            ("Context", "r", context),
+            ("Perspective", "r", perspective),
+        )
+        pooled = (base_conditions, _predicates_for(base_conditions))
+        _CONDITIONS_POOL[base_key] = pooled
+    conditions, predicates = pooled
+
+    triggers = _infer_triggers(hits)
+    if triggers:
+        trigger_conditions = tuple(
+            ("Trigger", "r", trigger) for trigger in triggers
+        )
+        conditions = conditions + trigger_conditions
+        predicates = predicates + _predicates_for(trigger_conditions)
 
     request_frames = _infer_request_frames(
         text, context_value, perspective_value, domain
     )
-    violation = _is_violation(text)
+    violation = _is_violation(hits)
     symbolic_rule = SymbolicRule(
-        rule_id=rule.id,
+        rule_id="",
         quantifier="forall",
         variables=["r"],
         conditions=conditions,
         conclusion=("Violation", "r"),
         violation=violation,
         dimensions={
-            "intent": list(INTENT_DIMENSIONS),
-            "perspective": list(PERSPECTIVE_DIMENSIONS),
+            "intent": _INTENT_LIST,
+            "perspective": _PERSPECTIVE_LIST,
             "request_frame": request_frames,
         },
+        predicates=predicates,
     )
-    symbolic_rule.predicates = symbolic_rule.to_predicate_list()
     return symbolic_rule
 
 
-def _infer_domain_from_text(text: str) -> Optional[str]:
-    keyword_map = {
-        "medical": ("medical", "health", "diagnosis", "treatment", "symptom"),
-        "self_harm": ("self harm", "self-harm", "suicide"),
-        "violence": ("weapon", "attack", "harm", "fight", "explosive"),
-        "privacy": ("personal data", "pii", "address", "phone", "ssn"),
-        "financial": ("money", "loan", "credit", "investment", "bet"),
-        "copyright": ("copyright", "plagiarize", "piracy"),
-        "political": ("election", "propaganda", "campaign"),
-    }
-    for domain, markers in keyword_map.items():
-        if any(marker in text for marker in markers):
-            return domain
+def _predicates_for(conditions: Tuple[Tuple[str, str, str], ...]) -> Tuple[str, ...]:
+    return tuple(
+        _pred(PREDICATE_ALIASES.get(name, name.lower()), value)
+        for name, _, value in conditions
+    )
+
+
+def _infer_domain_from_text(hits: Dict[str, set]) -> Optional[str]:
+    domain_hits = hits.get("domain")
+    if domain_hits:
+        for domain in DOMAIN_TEXT_PATTERNS:
+            if domain in domain_hits:
+                return domain
     return None
 
 
-def _infer_intent(text: str, domain: str) -> str:
-    for intent, markers in INTENT_PATTERNS.items():
-        if any(marker in text for marker in markers):
-            return intent
-    if "better" in text and "than" in text:
+def _infer_intent(hits: Dict[str, set], domain: str) -> str:
+    intent_hits = hits.get("intent")
+    if intent_hits:
+        for intent in INTENT_PATTERNS:
+            if intent in intent_hits:
+                return intent
+    fallback = hits.get("fallback", ())
+    if "better" in fallback and "than" in fallback:
         return "comparative"
-    if "optimize" in text or "efficient" in text:
+    if "efficient" in fallback:
         return "optimization"
     if domain == "self_harm":
         return "procedural"
     return DEFAULT_INTENT
 
 
-def _infer_user_role(text: str) -> Tuple[str, str]:
-    for predicate, markers in ROLE_PATTERNS.items():
-        if any(marker in text for marker in markers):
-            op, value = _split_predicate_token(predicate)
-            return op, value
-    if "non professional" in text or "non-professional" in text:
-        return "!=", "professional"
-    if "non clinician" in text or "non-clinician" in text:
-        return "!=", "clinician"
-    if "professional" in text:
+def _infer_user_role(hits: Dict[str, set]) -> Tuple[str, str]:
+    role_hits = hits.get("role")
+    if role_hits:
+        for predicate in ROLE_PATTERNS:
+            if predicate in role_hits:
+                return _split_predicate_token(predicate)
+    # Bare "professional" only matters when no explicit role marker matched.
+    if "professional" in hits.get("fallback", ()):
         return "=", "professional"
     return "=", DEFAULT_ROLE
 
 
-def _infer_context_clause(text: str) -> Tuple[str, str]:
-    for context, markers in CONTEXT_PATTERNS.items():
-        if any(marker in text for marker in markers):
-            if _contains_allowance_language(text):
-                # e.g., "only in prevention contexts" -> we forbid everything except prevention.
-                return "!=", context
-            return "=", context
+def _infer_context_clause(hits: Dict[str, set], text: str) -> Tuple[str, str]:
+    context_hits = hits.get("context")
+    if context_hits:
+        for context in CONTEXT_PATTERNS:
+            if context in context_hits:
+                if _contains_allowance_language(text):
+                    # e.g., "only in prevention contexts" -> we forbid everything except prevention.
+                    return "!=", context
+                return "=", context
     return "=", DEFAULT_CONTEXT
 
 
-def _infer_perspective(text: str) -> Tuple[str, str]:
-    for perspective, markers in PERSPECTIVE_PATTERNS.items():
-        if any(marker in text for marker in markers):
-            return "=", perspective
+def _infer_perspective(hits: Dict[str, set]) -> Tuple[str, str]:
+    perspective_hits = hits.get("perspective")
+    if perspective_hits:
+        for perspective in PERSPECTIVE_PATTERNS:
+            if perspective in perspective_hits:
+                return "=", perspective
     return "=", DEFAULT_PERSPECTIVE
 
 
@@ -304,12 +567,11 @@ def _contains_allowance_language(text: str) -> bool:
     return text.startswith("only ") or text.startswith("unless ")
 
 
-def _infer_triggers(text: str) -> List[str]:
-    triggers: List[str] = []
-    for name, markers in EMOTIONAL_TRIGGERS.items():
-        if any(marker in text for marker in markers):
-            triggers.append(name)
-    return triggers
+def _infer_triggers(hits: Dict[str, set]) -> List[str]:
+    trigger_hits = hits.get("trigger")
+    if not trigger_hits:
+        return []
+    return [name for name in EMOTIONAL_TRIGGERS if name in trigger_hits]
 
 
 def _split_predicate_token(token: str) -> Tuple[str, str]:
@@ -320,10 +582,8 @@ def _split_predicate_token(token: str) -> Tuple[str, str]:
     return "=", token
 
 
-def _is_violation(text: str) -> bool:
-    if any(marker in text for marker in VIOLATION_MARKERS):
-        return True
-    return "allow" not in text and "permitted" not in text
+def _is_violation(hits: Dict[str, set]) -> bool:
+    return "violation" in hits or "allowance" not in hits
 
 
 def _infer_request_frames(